@@ -27,7 +27,9 @@ WRAPPER_NAME="reshade"
 RAW_BASE="${RESHADE_RAW_BASE:-https://raw.githubusercontent.com/nesdeq/reshade/main}"
 
 # Python packages to install
-PYTHON_PACKAGES="rich questionary requests pefile"
+PYTHON_PACKAGES="rich questionary requests"
+# Optional speedups; installed best-effort
+OPTIONAL_PYTHON_PACKAGES="orjson"
 
 # Required system tools
 REQUIRED_TOOLS="python3 git 7z curl"
@@ -134,6 +136,7 @@ setup_venv() {
     info "Installing Python dependencies..."
     pip install --upgrade pip --quiet
     pip install ${PYTHON_PACKAGES} --quiet
+    pip install ${OPTIONAL_PYTHON_PACKAGES} --quiet || warn "Optional packages not installed: ${OPTIONAL_PYTHON_PACKAGES}"
 
     deactivate
 
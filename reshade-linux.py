@@ -11,24 +11,36 @@ Foundation; either version 2 of the License, or (at your option) any later versi
 
 from __future__ import annotations
 
+import atexit
+import functools
 import hashlib
+import importlib.util
 import json
 import os
 import re
 import shutil
+import stat
 import struct
 import subprocess
 import sys
 import tempfile
-from dataclasses import dataclass, field
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 # =============================================================================
 # Constants
 # =============================================================================
 
 RESHADE_URLS = ("https://reshade.me", "http://static.reshade.me")
+RESHADE_URL_RE = re.compile(r"/downloads/ReShade_Setup_([0-9.]+)\.exe")
+RESHADE_URL_ADDON_RE = re.compile(r"/downloads/ReShade_Setup_([0-9.]+_Addon)\.exe")
+
+# libraryfolders.vdf is ASCII, so it is matched as bytes without decoding
+VDF_PATH_RE = re.compile(rb'"path"\s+"([^"]+)"')
 
 SHADER_REPOS: list[tuple[str, str, Optional[str]]] = [
     ("https://github.com/crosire/reshade-shaders", "reshade-shaders", "slim"),
@@ -48,6 +60,7 @@ DLL_OPTIONS = (
     ("ddraw", "DirectDraw"),
     ("dinput8", "DirectInput 8"),
 )
+DLL_OPTION_BY_NAME = dict(DLL_OPTIONS)
 
 RESHADE_LINKS = (
     "d3d8.dll", "d3d9.dll", "d3d10.dll", "d3d11.dll", "dxgi.dll",
@@ -60,6 +73,33 @@ EXE_BLACKLIST = frozenset((
     "vc_redist", "dxsetup", "dotnet", "directx", "easyanticheat", "battleye",
     "redist", "vcredist", "physx",
 ))
+EXE_BLACKLIST_BYTES = tuple(b.encode() for b in EXE_BLACKLIST)
+
+# Game directory scanning: how deep to look for executables, which asset
+# directories never contain them, and how many to collect per game
+MAX_EXE_SCAN_DEPTH = 4
+MAX_EXES_PER_GAME = 50
+# Plausible size range for a PE executable (the format caps images at 4 GiB)
+EXE_MIN_SIZE = 4096
+EXE_MAX_SIZE = 4 * 1024 ** 3
+# Concurrent directory walks; kept low so rotational disks are not thrashed
+SCAN_MAX_WORKERS = 8
+# Concurrent shader repository clones/fetches; kept polite to GitHub
+SHADER_DOWNLOAD_MAX_WORKERS = 4
+EXE_SCAN_SKIP_DIRS = frozenset(("data", "assets", "content", "paks", "mods"))
+EXE_SCAN_SKIP_DIRS_BYTES = frozenset(d.encode() for d in EXE_SCAN_SKIP_DIRS)
+
+# Enough of a PE file to cover the DOS, NT and section headers of nearly any exe
+PE_HEADER_READ_SIZE = 4096
+
+# Imported DLLs that identify a graphics API (lowercase, as stored in the PE)
+GRAPHICS_DLLS = frozenset((
+    b"d3d8.dll", b"d3d9.dll", b"d3d10.dll", b"d3d10_1.dll", b"d3d11.dll",
+    b"d3d12.dll", b"dxgi.dll", b"opengl32.dll",
+))
+
+# How long a looked-up latest ReShade version is trusted before re-checking
+VERSION_CACHE_TTL = 6 * 3600
 
 SHADER_EXTENSIONS = frozenset((".fx", ".fxh"))
 TEXTURE_EXTENSIONS = frozenset((".png", ".jpg", ".jpeg", ".dds", ".bmp", ".tga"))
@@ -69,8 +109,20 @@ D3DCOMPILER_HASHES = {
     64: "721977f36c008af2b637aedd3f1b529f3cfed6feb10f68ebe17469acb1934986",
 }
 
-REQUIRED_PACKAGES = ("rich", "questionary", "requests", "pefile")
+# Large reads keep hashlib's OpenSSL backend on its bulk (SHA-NI) path
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+# Network reads stay small; the file buffer batches them into fewer writes
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
+# Bump when the games.json layout changes; older exe caches are then discarded
+GAMES_SCHEMA_VERSION = 1
+
+REQUIRED_PACKAGES = ("rich", "questionary", "requests")
 REQUIRED_TOOLS = ("7z", "git")
+TOOLS_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "reshade-linux/tools.json"
+)
 
 
 # =============================================================================
@@ -79,18 +131,28 @@ REQUIRED_TOOLS = ("7z", "git")
 
 def check_python_dependencies() -> list[str]:
     """Return list of missing Python packages."""
-    missing = []
-    for pkg in REQUIRED_PACKAGES:
-        try:
-            __import__(pkg)
-        except ImportError:
-            missing.append(pkg)
-    return missing
+    # find_spec only locates the package; it does not execute it
+    return [pkg for pkg in REQUIRED_PACKAGES if importlib.util.find_spec(pkg) is None]
 
 
 def check_system_tools() -> list[str]:
     """Return list of missing system tools."""
-    return [t for t in REQUIRED_TOOLS if shutil.which(t) is None]
+    path_env = os.environ.get("PATH", "")
+    try:
+        cached = json.loads(TOOLS_CACHE_PATH.read_text())
+        if cached.get("path") == path_env and cached.get("tools") == list(REQUIRED_TOOLS):
+            return []
+    except (json.JSONDecodeError, OSError, AttributeError):
+        pass
+
+    missing = [t for t in REQUIRED_TOOLS if shutil.which(t) is None]
+    if not missing:
+        try:
+            TOOLS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            TOOLS_CACHE_PATH.write_text(json.dumps({"path": path_env, "tools": list(REQUIRED_TOOLS)}))
+        except OSError:
+            pass
+    return missing
 
 
 def ensure_dependencies() -> None:
@@ -109,32 +171,93 @@ def ensure_dependencies() -> None:
         sys.exit(1)
 
 
+def lazy_import(name: str):
+    """Return a module whose code only runs on first attribute access."""
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
 # Check dependencies before importing optional packages
 ensure_dependencies()
 
-# Now safe to import
-import pefile
-import questionary
+# Now safe to import. questionary is loaded on first use: it pulls in
+# prompt_toolkit, which dominates startup time.
 import requests
-from questionary import Style
+from requests.adapters import HTTPAdapter
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 from rich.text import Text
+from urllib3.util.retry import Retry
+
+questionary = lazy_import("questionary")
+
+# Optional: faster games.json (de)serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 console = Console()
 
-QUESTIONARY_STYLE = Style([
-    ("qmark", "fg:cyan bold"),
-    ("question", "fg:white bold"),
-    ("answer", "fg:green bold"),
-    ("pointer", "fg:cyan bold"),
-    ("highlighted", "fg:cyan bold"),
-    ("selected", "fg:green"),
-    ("separator", "fg:gray"),
-    ("instruction", "fg:gray italic"),
-])
+# Static menu entries as (title, value); built into choices per prompt by menu_choices()
+MAIN_MENU_ENTRIES = (
+    ("Install ReShade to a game", "install"),
+    ("Uninstall ReShade from a game", "uninstall"),
+    ("Update shaders", "update_shaders"),
+    ("Update ReShade", "update_reshade"),
+)
+MAIN_MENU_TAIL_ENTRIES = (
+    ("Settings", "settings"),
+    ("Exit", "exit"),
+)
+DLL_OVERRIDE_ENTRIES = tuple(
+    (f"{name}.dll ({description})", name) for name, description in DLL_OPTIONS
+)
+SETTINGS_ENTRIES = (
+    ("Toggle addon support", "addon"),
+    ("Toggle shader merging", "merge"),
+    ("Clear saved games", "clear_games"),
+    ("Back to main menu", "back"),
+)
+
+INSTALL_SUCCESS_TEMPLATE = """[bold green]Installation complete![/]
+
+[cyan]Game:[/] {name}
+[cyan]Install path:[/] {install_path}
+[cyan]API:[/] {api} ({arch}-bit)
+[cyan]DLL:[/] {dll_used}.dll
+
+[yellow]Steam Launch Options:[/]
+[bold]WINEDLLOVERRIDES="d3dcompiler_47=n;{dll_used}=n,b" %command%[/]
+
+[dim]Copy this to Steam -> Right-click game -> Properties -> Launch Options[/]"""
+
+
+@functools.cache
+def questionary_style() -> questionary.Style:
+    """Shared prompt style, built on first use."""
+    return questionary.Style([
+        ("qmark", "fg:cyan bold"),
+        ("question", "fg:white bold"),
+        ("answer", "fg:green bold"),
+        ("pointer", "fg:cyan bold"),
+        ("highlighted", "fg:cyan bold"),
+        ("selected", "fg:green"),
+        ("separator", "fg:gray"),
+        ("instruction", "fg:gray italic"),
+    ])
+
+
+def menu_choices(entries: tuple[tuple[str, str], ...]) -> list:
+    """Build fresh choices for a fixed menu (questionary mutates the ones it shows)."""
+    return [questionary.Choice(title, value=value) for title, value in entries]
 
 
 # =============================================================================
@@ -212,6 +335,18 @@ class Config:
     def games_config_path(self) -> Path:
         return self.main_path / "games.json"
 
+    @property
+    def games_scan_cache_path(self) -> Path:
+        return self.main_path / "scan_cache.json"
+
+    @property
+    def page_cache_path(self) -> Path:
+        return self.main_path / ".reshade_etag"
+
+    @property
+    def latest_version_path(self) -> Path:
+        return self.main_path / "latest_version.json"
+
 
 # =============================================================================
 # Games Configuration Manager
@@ -223,20 +358,100 @@ class GamesConfigManager:
     def __init__(self, config_path: Path) -> None:
         self.config_path = config_path
         self._cache: dict[str, dict] = {}
+        self._exe_cache: dict[str, dict] = {}
+        self._dirty = False
+        self._mtime_ns: Optional[int] = None
         self._load()
+        atexit.register(self.flush)
 
     def _load(self) -> None:
         """Load games config from disk."""
-        if self.config_path.exists():
-            try:
-                self._cache = json.loads(self.config_path.read_text())
-            except (json.JSONDecodeError, OSError):
-                self._cache = {}
+        try:
+            self._mtime_ns = os.stat(self.config_path).st_mtime_ns
+            raw = self.config_path.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+        except (json.JSONDecodeError, OSError):
+            return
+        if "schema_version" not in data:
+            # Legacy layout: the whole file is the games mapping
+            self._cache = data
+            return
+        self._cache = data.get("games", {})
+        if data["schema_version"] == GAMES_SCHEMA_VERSION:
+            self._exe_cache = data.get("exe_cache", {})
+
+    def _refresh(self) -> None:
+        """Reload from disk if another process changed the file since we read it."""
+        if self._dirty:
+            return
+        try:
+            mtime_ns = os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return
+        if mtime_ns != self._mtime_ns:
+            self._cache = {}
+            self._exe_cache = {}
+            self._load()
 
     def _save(self) -> None:
-        """Save games config to disk."""
+        """Save games config to disk atomically."""
+        data = {
+            "schema_version": GAMES_SCHEMA_VERSION,
+            "games": self._cache,
+            "exe_cache": self._exe_cache,
+        }
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        self.config_path.write_text(json.dumps(self._cache, indent=2))
+        tmp_path = self.config_path.with_suffix(".json.tmp")
+        try:
+            if orjson:
+                tmp_path.write_bytes(orjson.dumps(data))
+            else:
+                tmp_path.write_text(json.dumps(data, separators=(",", ":")))
+            os.replace(tmp_path, self.config_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self._mtime_ns = os.stat(self.config_path).st_mtime_ns
+
+    def flush(self) -> None:
+        """Write pending changes to disk, if any; a failed write is reported and kept pending."""
+        if not self._dirty:
+            return
+        try:
+            self._save()
+        except OSError as e:
+            console.print(f"[bold red]Failed to save {self.config_path}: {e}[/]")
+            return
+        self._dirty = False
+
+    def clear(self) -> None:
+        """Forget all saved games and delete the config file."""
+        self._cache = {}
+        self._exe_cache = {}
+        self._dirty = False
+        self.config_path.unlink(missing_ok=True)
+
+    def get_exe_analysis(self, exe_path: str, st: os.stat_result) -> Optional[tuple[int, str, str]]:
+        """Return a cached analyze_executable result if the file is unchanged."""
+        entry = self._exe_cache.get(exe_path)
+        if entry and entry.get("mtime") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            try:
+                return entry["arch"], entry["api"], entry["dll"]
+            except KeyError:
+                return None
+        return None
+
+    def save_exe_analysis(self, exe_path: str, st: os.stat_result, result: tuple[int, str, str]) -> None:
+        """Remember an analyze_executable result for an executable."""
+        arch, api, dll = result
+        self._exe_cache[exe_path] = {
+            "mtime": st.st_mtime_ns,
+            "size": st.st_size,
+            "arch": arch,
+            "api": api,
+            "dll": dll,
+        }
+        self._dirty = True
 
     def _game_key(self, game_path: Path) -> str:
         """Generate unique key for a game based on its path."""
@@ -244,6 +459,7 @@ class GamesConfigManager:
 
     def get(self, game_path: Path) -> Optional[GameInfo]:
         """Get saved configuration for a game."""
+        self._refresh()
         key = self._game_key(game_path)
         if key in self._cache:
             try:
@@ -256,17 +472,18 @@ class GamesConfigManager:
         """Save game configuration."""
         key = self._game_key(game.path)
         self._cache[key] = game.to_dict()
-        self._save()
+        self._dirty = True
 
     def remove(self, game_path: Path) -> None:
         """Remove game configuration."""
         key = self._game_key(game_path)
         if key in self._cache:
             del self._cache[key]
-            self._save()
+            self._dirty = True
 
     def list_all(self) -> list[GameInfo]:
         """List all saved game configurations."""
+        self._refresh()
         games = []
         for data in self._cache.values():
             try:
@@ -304,68 +521,198 @@ def safe_unlink(path: Path) -> bool:
 # Executable Analysis
 # =============================================================================
 
-def analyze_executable(exe_path: Path) -> tuple[int, str, str]:
+def read_pe_imports(fd: int) -> tuple[int, set[bytes]]:
+    """
+    Read the machine type and imported graphics DLLs from a PE file descriptor.
+
+    Returns: (machine, imports)
+    """
+    data = os.pread(fd, PE_HEADER_READ_SIZE, 0)
+    if data[:2] != b"MZ":
+        raise ValueError("missing MZ signature")
+    pe_offset = struct.unpack_from("<I", data, 0x3C)[0]
+    if pe_offset + 24 > len(data):
+        data = os.pread(fd, pe_offset + PE_HEADER_READ_SIZE, 0)
+    if data[pe_offset:pe_offset + 4] != b"PE\0\0":
+        raise ValueError("missing PE signature")
+
+    machine, num_sections = struct.unpack_from("<HH", data, pe_offset + 4)
+    opt_size = struct.unpack_from("<H", data, pe_offset + 20)[0]
+    opt_offset = pe_offset + 24
+    sections_offset = opt_offset + opt_size
+    if sections_offset + num_sections * 40 > len(data):
+        data = os.pread(fd, sections_offset + num_sections * 40, 0)
+
+    magic = struct.unpack_from("<H", data, opt_offset)[0]
+    if magic == 0x10B:  # PE32
+        num_dirs_offset = opt_offset + 92
+    elif magic == 0x20B:  # PE32+
+        num_dirs_offset = opt_offset + 108
+    else:
+        return machine, set()
+
+    # Data directory 1 is the import table
+    if struct.unpack_from("<I", data, num_dirs_offset)[0] < 2:
+        return machine, set()
+    import_rva, import_size = struct.unpack_from("<II", data, num_dirs_offset + 4 + 8)
+    if not import_rva:
+        return machine, set()
+
+    sections = [
+        struct.unpack_from("<IIII", data, sections_offset + i * 40 + 8)
+        for i in range(num_sections)
+    ]
+
+    def rva_to_offset(rva: int) -> int:
+        for virtual_size, virtual_address, raw_size, raw_pointer in sections:
+            if virtual_address <= rva < virtual_address + max(virtual_size, raw_size):
+                return rva - virtual_address + raw_pointer
+        raise ValueError(f"RVA {rva:#x} outside of any section")
+
+    # IMAGE_IMPORT_DESCRIPTORs are 20 bytes each, ending with an all-zero entry
+    descriptors = os.pread(fd, max(import_size, 20), rva_to_offset(import_rva))
+    imports: set[bytes] = set()
+    for offset in range(0, len(descriptors) - 19, 20):
+        fields = struct.unpack_from("<5I", descriptors, offset)
+        if not any(fields):
+            break
+        # Name is the fourth field
+        name = os.pread(fd, 256, rva_to_offset(fields[3])).split(b"\0", 1)[0].lower()
+        if name in GRAPHICS_DLLS:
+            imports.add(name)
+
+    return machine, imports
+
+
+def analyze_executable(
+    exe_path: Path, games_config: Optional[GamesConfigManager] = None
+) -> tuple[int, str, str]:
     """
     Analyze an executable to determine architecture and graphics API.
 
     Returns: (architecture, api, dll_override)
     """
+    path_str = os.path.abspath(exe_path)
+    try:
+        st = os.stat(path_str)
+    except OSError:
+        return _analyze_pe(exe_path)
+
+    if games_config is not None:
+        result = games_config.get_exe_analysis(path_str, st)
+        if result is not None:
+            return result
+
+    result = _analyze_cached(path_str, st.st_mtime_ns, st.st_size)
+    if games_config is not None:
+        games_config.save_exe_analysis(path_str, st, result)
+    return result
+
+
+@functools.lru_cache(maxsize=256)
+def _analyze_cached(path_str: str, mtime_ns: int, size: int) -> tuple[int, str, str]:
+    """analyze_executable result for one (path, mtime, size) fingerprint."""
+    return _analyze_pe(Path(path_str))
+
+
+def _analyze_pe(exe_path: Path) -> tuple[int, str, str]:
+    """Uncached body of analyze_executable."""
     arch = 64
     api = "dx11"
     dll = "dxgi"
 
     try:
-        pe = pefile.PE(str(exe_path), fast_load=True)
-        pe.parse_data_directories(
-            directories=[pefile.DIRECTORY_ENTRY["IMAGE_DIRECTORY_ENTRY_IMPORT"]]
-        )
+        with open(exe_path, "rb") as f:
+            machine, imports = read_pe_imports(f.fileno())
+    except (OSError, ValueError, struct.error):
+        return arch, api, dll
+
+    if machine == 0x14C:  # IMAGE_FILE_MACHINE_I386
+        arch = 32
+
+    if b"d3d12.dll" in imports:
+        api, dll = "dx12", "dxgi"
+    elif b"d3d11.dll" in imports or b"dxgi.dll" in imports:
+        api, dll = "dx11", "dxgi"
+    elif b"d3d10.dll" in imports or b"d3d10_1.dll" in imports:
+        api, dll = "dx10", "d3d10"
+    elif b"d3d9.dll" in imports:
+        api, dll = "dx9", "d3d9"
+    elif b"opengl32.dll" in imports:
+        api, dll = "opengl", "opengl32"
+    elif b"d3d8.dll" in imports:
+        api, dll = "dx8", "d3d8"
 
-        # Check architecture
-        if pe.FILE_HEADER.Machine == pefile.MACHINE_TYPE["IMAGE_FILE_MACHINE_I386"]:
-            arch = 32
+    return arch, api, dll
 
-        # Check imported DLLs for graphics API
-        if hasattr(pe, "DIRECTORY_ENTRY_IMPORT"):
-            imports = {
-                entry.dll.decode("utf-8", errors="ignore").lower()
-                for entry in pe.DIRECTORY_ENTRY_IMPORT
-            }
 
-            if "d3d12.dll" in imports:
-                api, dll = "dx12", "dxgi"
-            elif "d3d11.dll" in imports or "dxgi.dll" in imports:
-                api, dll = "dx11", "dxgi"
-            elif "d3d10.dll" in imports or "d3d10_1.dll" in imports:
-                api, dll = "dx10", "d3d10"
-            elif "d3d9.dll" in imports:
-                api, dll = "dx9", "d3d9"
-            elif "opengl32.dll" in imports:
-                api, dll = "opengl", "opengl32"
-            elif "d3d8.dll" in imports:
-                api, dll = "dx8", "d3d8"
-
-        pe.close()
-
-    except Exception:
-        # Fallback: PE header gives us architecture only; leave api/dll at defaults
-        try:
-            with open(exe_path, "rb") as f:
-                f.seek(0x3C)
-                pe_offset = struct.unpack("<I", f.read(4))[0]
-                f.seek(pe_offset + 4)
-                machine = struct.unpack("<H", f.read(2))[0]
-                if machine == 0x14C:  # IMAGE_FILE_MACHINE_I386
-                    arch = 32
-        except Exception:
-            pass
+@functools.lru_cache(maxsize=4096)
+def is_game_executable(name: str | bytes) -> bool:
+    """Check if an executable file name (str or bytes) is likely a game, not a tool/installer."""
+    name_lower = name.lower()
+    blacklist = EXE_BLACKLIST_BYTES if isinstance(name, bytes) else EXE_BLACKLIST
+    return not any(blacklisted in name_lower for blacklisted in blacklist)
 
-    return arch, api, dll
 
+def has_pe_magic(path: str) -> bool:
+    """Check whether a file starts with the DOS "MZ" signature."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(2) == b"MZ"
+    except OSError:
+        return False
 
-def is_game_executable(exe_path: Path) -> bool:
-    """Check if an executable is likely a game (not a tool/installer)."""
-    name_lower = exe_path.name.lower()
-    return not any(blacklisted in name_lower for blacklisted in EXE_BLACKLIST)
+
+def list_game_executables(directory: Path) -> list[Path]:
+    """List game executables directly inside directory, filtered by name, size and MZ signature."""
+    exe_files: list[Path] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.name.lower().endswith(".exe") or not is_game_executable(entry.name):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+                if not EXE_MIN_SIZE <= size <= EXE_MAX_SIZE or not has_pe_magic(entry.path):
+                    continue
+                exe_files.append(Path(entry.path))
+                if len(exe_files) >= MAX_EXES_PER_GAME:
+                    break
+    except (NotADirectoryError, FileNotFoundError):
+        pass
+    return exe_files
+
+
+def find_game_executables(game_dir: Path) -> list[Path]:
+    """Breadth-first search for game executables below game_dir, bounded in depth and count."""
+    exe_files: list[Path] = []
+    # Walk with bytes paths so names are filtered before any str/Path is built
+    queue = deque([(os.fsencode(game_dir), 0)])
+    while queue:
+        dir_path, depth = queue.popleft()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    name_lower = entry.name.lower()
+                    if name_lower.endswith(b".exe"):
+                        if not is_game_executable(name_lower):
+                            continue
+                        exe_files.append(Path(os.fsdecode(entry.path)))
+                        if len(exe_files) >= MAX_EXES_PER_GAME:
+                            return exe_files
+                    elif (
+                        depth < MAX_EXE_SCAN_DEPTH
+                        and name_lower not in EXE_SCAN_SKIP_DIRS_BYTES
+                        and entry.is_dir(follow_symlinks=False)
+                    ):
+                        queue.append((entry.path, depth + 1))
+        except OSError:
+            continue
+    return exe_files
 
 
 # =============================================================================
@@ -391,9 +738,14 @@ class SteamScanner:
         for vdf_path in vdf_locations:
             if vdf_path.exists():
                 try:
-                    content = vdf_path.read_text()
-                    for path_match in re.findall(r'"path"\s+"([^"]+)"', content):
-                        lib_path = Path(path_match) / "steamapps/common"
+                    for line in vdf_path.read_bytes().splitlines():
+                        line = line.strip()
+                        if not line.startswith(b'"path"'):
+                            continue
+                        match = VDF_PATH_RE.match(line)
+                        if not match:
+                            continue
+                        lib_path = Path(os.fsdecode(match.group(1))) / "steamapps/common"
                         if lib_path.is_dir():
                             libraries.add(lib_path)
                 except OSError:
@@ -419,37 +771,43 @@ class SteamScanner:
         self.library_paths = sorted(libraries)
         return self.library_paths
 
+    def _scan_game_dir(self, game_dir: Path) -> Optional[GameInfo]:
+        """Collect a game directory's executables, or None if it has none."""
+        exe_files = find_game_executables(game_dir)
+        if not exe_files:
+            return None
+        return GameInfo(name=game_dir.name, path=game_dir, exe_files=exe_files)
+
     def scan_for_games(self) -> list[GameInfo]:
         """Scan all Steam libraries for games with executables."""
         if not self.library_paths:
             self.find_libraries()
 
+        game_dirs = [
+            game_dir
+            for lib_path in self.library_paths
+            for game_dir in lib_path.iterdir()
+            if game_dir.is_dir()
+        ]
         games: list[GameInfo] = []
 
         with Progress(
             SpinnerColumn(),
             TextColumn("[cyan]Scanning for games..."),
+            BarColumn(),
+            TaskProgressColumn(),
             console=console,
             transient=True,
         ) as progress:
-            progress.add_task("Scanning", total=None)
+            task = progress.add_task("Scanning", total=len(game_dirs))
 
-            for lib_path in self.library_paths:
-                for game_dir in lib_path.iterdir():
-                    if not game_dir.is_dir():
-                        continue
-
-                    exe_files = [
-                        exe for exe in game_dir.rglob("*.exe")
-                        if is_game_executable(exe)
-                    ]
-
-                    if exe_files:
-                        games.append(GameInfo(
-                            name=game_dir.name,
-                            path=game_dir,
-                            exe_files=exe_files,
-                        ))
+            with ThreadPoolExecutor(max_workers=min(SCAN_MAX_WORKERS, os.cpu_count() or 1)) as executor:
+                futures = [executor.submit(self._scan_game_dir, d) for d in game_dirs]
+                for future in as_completed(futures):
+                    game = future.result()
+                    if game:
+                        games.append(game)
+                    progress.update(task, advance=1)
 
         return sorted(games, key=lambda g: g.name.lower())
 
@@ -465,8 +823,17 @@ class ReShadeInstaller:
         self.config = config or Config()
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "ReShade-Linux-Installer/2.0"})
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504)),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.games_config = GamesConfigManager(self.config.games_config_path)
         self.steam_scanner = SteamScanner()
+        self._games_cache: Optional[list[GameInfo]] = None
+        self._games_cache_sig: tuple[tuple[str, int], ...] = ()
 
     def setup_directories(self) -> None:
         """Create necessary directories."""
@@ -481,17 +848,130 @@ class ReShadeInstaller:
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
 
-    def get_latest_reshade_version(self) -> tuple[str, str]:
-        """Fetch the latest ReShade version and download URL."""
-        pattern_suffix = r"_Addon" if self.config.addon_support else ""
-        pattern = rf"/downloads/ReShade_Setup_([0-9.]+{pattern_suffix})\.exe"
+    def _library_signature(self) -> tuple[tuple[str, int], ...]:
+        """Fingerprint the Steam libraries by library and game directory mtimes."""
+        if not self.steam_scanner.library_paths:
+            self.steam_scanner.find_libraries()
+        signature = []
+        for lib_path in self.steam_scanner.library_paths:
+            try:
+                signature.append((str(lib_path), lib_path.stat().st_mtime_ns))
+                with os.scandir(lib_path) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            signature.append((entry.path, entry.stat().st_mtime_ns))
+            except OSError:
+                continue
+        return tuple(sorted(signature))
+
+    def _load_games_scan_cache(self) -> None:
+        """Load the persisted scan result from a previous run."""
+        try:
+            data = json.loads(self.config.games_scan_cache_path.read_text())
+            self._games_cache_sig = tuple((path, mtime) for path, mtime in data["signature"])
+            self._games_cache = [
+                GameInfo(
+                    name=g["name"],
+                    path=Path(g["path"]),
+                    exe_files=[Path(e) for e in g["exe_files"]],
+                )
+                for g in data["games"]
+            ]
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError):
+            self._games_cache = None
+
+    def _save_games_scan_cache(self) -> None:
+        """Persist the current scan result for the next run."""
+        data = {
+            "signature": self._games_cache_sig,
+            "games": [
+                {"name": g.name, "path": str(g.path), "exe_files": [str(e) for e in g.exe_files]}
+                for g in self._games_cache or []
+            ],
+        }
+        try:
+            self.config.games_scan_cache_path.write_text(json.dumps(data))
+        except OSError:
+            pass
+
+    def scan_games(self, force: bool = False) -> list[GameInfo]:
+        """Return copies of the cached Steam games, rescanning when stale or forced."""
+        if self._games_cache is None and not force:
+            self._load_games_scan_cache()
 
-        for base_url in RESHADE_URLS:
+        signature = self._library_signature()
+        if force or self._games_cache is None or signature != self._games_cache_sig:
+            self._games_cache = self.steam_scanner.scan_for_games()
+            self._games_cache_sig = signature
+            self._save_games_scan_cache()
+
+        return [replace(g, exe_files=list(g.exe_files)) for g in self._games_cache]
+
+    def _fetch_page(self, url: str) -> str:
+        """GET a page, revalidating a cached copy with its ETag/Last-Modified."""
+        cache_path = self.config.page_cache_path
+        try:
+            cache = json.loads(cache_path.read_text())
+        except (json.JSONDecodeError, OSError):
+            cache = {}
+        cached = cache.get(url, {})
+
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self.session.get(url, headers=headers, timeout=15)
+        if response.status_code == 304 and "text" in cached:
+            return cached["text"]
+        response.raise_for_status()
+
+        if "ETag" in response.headers or "Last-Modified" in response.headers:
+            cache[url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "text": response.text,
+            }
             try:
-                response = self.session.get(base_url, timeout=15)
-                response.raise_for_status()
+                cache_path.write_text(json.dumps(cache))
+            except OSError:
+                pass
+        return response.text
+
+    def get_latest_reshade_version(self, force: bool = False) -> tuple[str, str]:
+        """Fetch the latest ReShade version and download URL, cached unless forced."""
+        cache_path = self.config.latest_version_path
+        if not force:
+            try:
+                cached = json.loads(cache_path.read_text())
+                if (
+                    cached["addon"] == self.config.addon_support
+                    and 0 <= time.time() - cached["ts"] < VERSION_CACHE_TTL
+                ):
+                    return cached["version"], cached["url"]
+            except (json.JSONDecodeError, OSError, KeyError, TypeError):
+                pass
+
+        version, download_url = self._lookup_latest_reshade_version()
+        try:
+            cache_path.write_text(json.dumps({
+                "version": version,
+                "url": download_url,
+                "addon": self.config.addon_support,
+                "ts": time.time(),
+            }))
+        except OSError:
+            pass
+        return version, download_url
+
+    def _lookup_latest_reshade_version(self) -> tuple[str, str]:
+        """Scrape the latest ReShade version and download URL from the site."""
+        pattern = RESHADE_URL_ADDON_RE if self.config.addon_support else RESHADE_URL_RE
 
-                match = re.search(pattern, response.text)
+        for base_url in RESHADE_URLS:
+            try:
+                match = pattern.search(self._fetch_page(base_url))
                 if match:
                     version = match.group(1)
                     download_url = f"{base_url}/downloads/ReShade_Setup_{version}.exe"
@@ -520,18 +1000,15 @@ class ReShadeInstaller:
                 TaskProgressColumn(),
                 console=console,
             ) as progress:
-                task = progress.add_task("Download", total=100)
+                with self.session.get(url, stream=True, timeout=30) as response:
+                    response.raise_for_status()
+                    total = int(response.headers.get("content-length", 0))
+                    task = progress.add_task("Download", total=total or None)
 
-                response = self.session.get(url, stream=True)
-                total = int(response.headers.get("content-length", 0))
-
-                with open(exe_path, "wb") as f:
-                    downloaded = 0
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total:
-                            progress.update(task, completed=int(downloaded * 100 / total))
+                    with open(exe_path, "wb", buffering=DOWNLOAD_BUFFER_SIZE) as f:
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            progress.update(task, advance=len(chunk))
 
             console.print("[cyan]Extracting ReShade...")
             version_path.mkdir(parents=True, exist_ok=True)
@@ -569,12 +1046,17 @@ class ReShadeInstaller:
             tmp_path = Path(tmpdir)
             ff_exe = tmp_path / "firefox.exe"
 
-            response = self.session.get(ff_url)
-            ff_exe.write_bytes(response.content)
+            # Hash while streaming to disk so the installer is only walked once
+            h = hashlib.sha256()
+            with self.session.get(ff_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                with open(ff_exe, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=HASH_CHUNK_SIZE):
+                        f.write(chunk)
+                        h.update(chunk)
 
             # Verify hash
-            file_hash = hashlib.sha256(ff_exe.read_bytes()).hexdigest()
-            if file_hash != D3DCOMPILER_HASHES[arch]:
+            if h.hexdigest() != D3DCOMPILER_HASHES[arch]:
                 raise RuntimeError("Firefox integrity check failed")
 
             # Extract
@@ -595,8 +1077,16 @@ class ReShadeInstaller:
 
         try:
             if repo_path.exists():
+                git = ["git", "-C", str(repo_path)]
+                result = subprocess.run(
+                    [*git, "fetch", "--depth", "1"],
+                    capture_output=True,
+                    timeout=60,
+                )
+                if result.returncode != 0:
+                    return False
                 result = subprocess.run(
-                    ["git", "-C", str(repo_path), "pull"],
+                    [*git, "reset", "--hard", "FETCH_HEAD"],
                     capture_output=True,
                     timeout=60,
                 )
@@ -628,10 +1118,13 @@ class ReShadeInstaller:
         ) as progress:
             task = progress.add_task("Shaders", total=len(repos))
 
-            for url, name, branch in repos:
-                progress.update(task, description=f"[cyan]{name}...")
-                self.clone_or_update_repo(url, name, branch)
-                progress.update(task, advance=1)
+            with ThreadPoolExecutor(max_workers=min(SHADER_DOWNLOAD_MAX_WORKERS, len(repos))) as executor:
+                futures = {
+                    executor.submit(self.clone_or_update_repo, url, name, branch): name
+                    for url, name, branch in repos
+                }
+                for future in as_completed(futures):
+                    progress.update(task, description=f"[cyan]{futures[future]}", advance=1)
 
         if self.config.merge_shaders:
             self.merge_shaders()
@@ -643,71 +1136,98 @@ class ReShadeInstaller:
         merged_shaders = self.config.merged_path / "Shaders"
         merged_textures = self.config.merged_path / "Textures"
 
-        # Clear existing symlinks
-        for directory in (merged_shaders, merged_textures):
-            if directory.exists():
-                for item in directory.iterdir():
-                    if item.is_symlink():
-                        item.unlink()
+        # File name -> linked source, one namespace per merged directory
+        seen_shaders: dict[str, str] = {}
+        seen_textures: dict[str, str] = {}
 
-        seen_shaders: set[str] = set()
-        seen_textures: set[str] = set()
-
-        def link_file(source: Path, target_dir: Path) -> bool:
+        def link_file(entry: os.DirEntry, target_dir: Path) -> bool:
             """Link a file if not already seen in its own namespace."""
             seen = seen_shaders if target_dir is merged_shaders else seen_textures
-            if source.name in seen:
+            if entry.name in seen:
                 return False
-            seen.add(source.name)
-            target = target_dir / source.name
-            if not target.exists():
-                target.symlink_to(source.resolve())
-                return True
-            return False
-
-        # Merge from shader repositories
-        for repo_dir in self.config.shaders_path.iterdir():
-            if repo_dir.name == "Merged" or not repo_dir.is_dir():
-                continue
+            seen[entry.name] = entry.path
+            try:
+                os.symlink(entry.path, entry.name, dir_fd=dir_fds[target_dir])
+            except FileExistsError:
+                return False
+            return True
+
+        def walk_sources(
+            root: Path, in_shaders: bool = False, in_textures: bool = False
+        ) -> Iterator[tuple[os.DirEntry, Path]]:
+            """Yield (entry, merged dir) for each shader or texture file under root."""
+            stack = [(str(root), in_shaders, in_textures)]
+            while stack:
+                dir_path, in_shaders, in_textures = stack.pop()
+                try:
+                    with os.scandir(dir_path) as it:
+                        for entry in it:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append((
+                                    entry.path,
+                                    in_shaders or entry.name == "Shaders",
+                                    in_textures or entry.name == "Textures",
+                                ))
+                                continue
+                            if not (in_shaders or in_textures) or not entry.is_file():
+                                continue
+                            suffix = os.path.splitext(entry.name)[1].lower()
+                            if in_shaders and suffix in SHADER_EXTENSIONS:
+                                yield entry, merged_shaders
+                            elif in_textures and suffix in TEXTURE_EXTENSIONS:
+                                yield entry, merged_textures
+                except OSError:
+                    continue
 
-            for shaders_dir in repo_dir.rglob("Shaders"):
-                if shaders_dir.is_dir():
-                    for shader_file in shaders_dir.rglob("*"):
-                        if shader_file.is_file() and shader_file.suffix.lower() in SHADER_EXTENSIONS:
-                            link_file(shader_file, merged_shaders)
-
-            for textures_dir in repo_dir.rglob("Textures"):
-                if textures_dir.is_dir():
-                    for texture_file in textures_dir.rglob("*"):
-                        if texture_file.is_file() and texture_file.suffix.lower() in TEXTURE_EXTENSIONS:
-                            link_file(texture_file, merged_textures)
-
-        # Merge from External_shaders directory
-        external = self.config.external_shaders_path
-        if external.exists():
-            # Check subdirectories
-            ext_shaders = external / "Shaders"
-            ext_textures = external / "Textures"
-
-            if ext_shaders.exists():
-                for f in ext_shaders.rglob("*"):
-                    if f.is_file() and f.suffix.lower() in SHADER_EXTENSIONS:
-                        link_file(f, merged_shaders)
-
-            if ext_textures.exists():
-                for f in ext_textures.rglob("*"):
-                    if f.is_file() and f.suffix.lower() in TEXTURE_EXTENSIONS:
-                        link_file(f, merged_textures)
-
-            # Loose files in External_shaders root
-            for item in external.iterdir():
-                if not item.is_file():
+        # Clear and create links relative to open directory handles
+        # (unlinkat/symlinkat) so the merged path is not looked up per file
+        dir_fds: dict[Path, int] = {}
+        try:
+            for directory in (merged_shaders, merged_textures):
+                directory.mkdir(parents=True, exist_ok=True)
+                dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+                dir_fds[directory] = dir_fd
+
+                # Clear existing symlinks; is_symlink() uses the cached d_type
+                with os.scandir(dir_fd) as it:
+                    for entry in it:
+                        if entry.is_symlink():
+                            os.unlink(entry.name, dir_fd=dir_fd)
+
+            # Merge from shader repositories
+            for repo_dir in self.config.shaders_path.iterdir():
+                if repo_dir.name == "Merged" or not repo_dir.is_dir():
                     continue
-                suffix = item.suffix.lower()
-                if suffix in SHADER_EXTENSIONS:
-                    link_file(item, merged_shaders)
-                elif suffix in TEXTURE_EXTENSIONS:
-                    link_file(item, merged_textures)
+                for entry, target_dir in walk_sources(repo_dir.resolve()):
+                    link_file(entry, target_dir)
+
+            # Merge from External_shaders/Shaders and /Textures, which may be
+            # symlinks to packs kept elsewhere
+            external = self.config.external_shaders_path
+            if external.exists():
+                for subdir, wanted in (("Shaders", merged_shaders), ("Textures", merged_textures)):
+                    root = (external / subdir).resolve()
+                    for entry, target_dir in walk_sources(
+                        root,
+                        in_shaders=wanted is merged_shaders,
+                        in_textures=wanted is merged_textures,
+                    ):
+                        if target_dir is wanted:
+                            link_file(entry, target_dir)
+
+                # Loose files in External_shaders root
+                with os.scandir(external.resolve()) as it:
+                    for entry in it:
+                        if not entry.is_file():
+                            continue
+                        suffix = os.path.splitext(entry.name)[1].lower()
+                        if suffix in SHADER_EXTENSIONS:
+                            link_file(entry, merged_shaders)
+                        elif suffix in TEXTURE_EXTENSIONS:
+                            link_file(entry, merged_textures)
+        finally:
+            for fd in dir_fds.values():
+                os.close(fd)
 
         console.print(f"[green]Merged {len(seen_shaders)} shaders, {len(seen_textures)} textures[/]")
 
@@ -877,18 +1397,18 @@ def display_banner() -> None:
 
 def ask_select(message: str, choices: list):
     """Wrapper for questionary select with consistent styling."""
-    return questionary.select(message, choices=choices, style=QUESTIONARY_STYLE).ask()
+    return questionary.select(message, choices=choices, style=questionary_style()).ask()
 
 
 def ask_confirm(message: str, default: bool = True) -> bool:
     """Wrapper for questionary confirm with consistent styling."""
-    result = questionary.confirm(message, default=default, style=QUESTIONARY_STYLE).ask()
+    result = questionary.confirm(message, default=default, style=questionary_style()).ask()
     return result if result is not None else False
 
 
 def ask_path(message: str) -> Optional[str]:
     """Wrapper for questionary path with consistent styling."""
-    return questionary.path(message, style=QUESTIONARY_STYLE).ask()
+    return questionary.path(message, style=questionary_style()).ask()
 
 
 # =============================================================================
@@ -901,11 +1421,14 @@ def select_game(games: list[GameInfo]) -> Optional[GameInfo | str]:
         console.print("[yellow]No games found![/]")
         return None
 
-    choices = [
-        questionary.Choice(title=g.name, value=g) for g in games
-    ]
-    choices.append(questionary.Choice(title="[Browse manually...]", value="manual"))
-    choices.append(questionary.Choice(title="[Cancel]", value=None))
+    # Sized up front: one entry per game plus "Browse", "Rescan" and "Cancel"
+    n = len(games)
+    choices = [None] * (n + 3)
+    for i, g in enumerate(games):
+        choices[i] = questionary.Choice(title=g.name, value=g)
+    choices[n] = questionary.Choice(title="[Browse manually...]", value="manual")
+    choices[n + 1] = questionary.Choice(title="[Rescan Steam libraries]", value="rescan")
+    choices[n + 2] = questionary.Choice(title="[Cancel]", value=None)
 
     return ask_select("Select a game:", choices)
 
@@ -919,20 +1442,19 @@ def browse_for_game() -> Optional[GameInfo]:
 
     path = Path(path_str).expanduser().resolve()
 
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         console.print("[red]Path does not exist![/]")
         return None
 
-    if path.is_file() and path.suffix.lower() == ".exe":
+    if stat.S_ISREG(st.st_mode) and path.suffix.lower() == ".exe":
         install_path = path.parent
         exe_files = [path]
         name = path.parent.name
     else:
         install_path = path
-        exe_files = [
-            exe for exe in path.glob("*.exe")
-            if is_game_executable(exe)
-        ]
+        exe_files = list_game_executables(path)
         name = path.name
         if not exe_files:
             console.print("[yellow]No .exe files found in directory[/]")
@@ -971,19 +1493,18 @@ def select_exe_for_analysis(game: GameInfo, installer: ReShadeInstaller) -> Game
     else:
         console.print(f"\n[cyan]Found {len(game.exe_files)} executables in {game.name}[/]")
 
-        # Show limited choices
-        exe_choices = [
-            questionary.Choice(
-                title=str(e.relative_to(game.path)) if game.path in e.parents else e.name,
-                value=e,
-            )
-            for e in game.exe_files[:20]
-        ]
+        # Show limited choices, titled relative to the game directory when inside it
+        prefix = os.path.join(str(game.path), "")
+        exe_choices = []
+        for e in game.exe_files[:20]:
+            e_str = str(e)
+            title = e_str[len(prefix):] if e_str.startswith(prefix) else e.name
+            exe_choices.append(questionary.Choice(title=title, value=e))
 
         exe = ask_select("Select the main game executable:", exe_choices)
 
     if exe:
-        arch, api, dll = analyze_executable(exe)
+        arch, api, dll = analyze_executable(exe, installer.games_config)
         game.architecture = arch
         game.detected_api = api
         game.dll_override = dll
@@ -998,15 +1519,13 @@ def select_exe_for_analysis(game: GameInfo, installer: ReShadeInstaller) -> Game
 
 def configure_dll_override(game: GameInfo) -> GameInfo:
     """Let user confirm or change the DLL override."""
-    choices = []
-
-    for dll_name, description in DLL_OPTIONS:
-        title = f"{dll_name}.dll ({description})"
-        if dll_name == game.dll_override:
-            title += " [detected]"
-            choices.insert(0, questionary.Choice(title, value=dll_name))
-        else:
-            choices.append(questionary.Choice(title, value=dll_name))
+    detected = game.dll_override
+    choices = [c for c in menu_choices(DLL_OVERRIDE_ENTRIES) if c.value != detected]
+    if detected in DLL_OPTION_BY_NAME:
+        choices.insert(0, questionary.Choice(
+            f"{detected}.dll ({DLL_OPTION_BY_NAME[detected]}) [detected]",
+            value=detected,
+        ))
 
     result = ask_select("Select DLL override:", choices)
     if result:
@@ -1025,7 +1544,7 @@ def select_shader_repos() -> list[tuple]:
     result = questionary.checkbox(
         "Select shader repositories to install:",
         choices=choices,
-        style=QUESTIONARY_STYLE,
+        style=questionary_style(),
     ).ask()
 
     return result or []
@@ -1035,12 +1554,7 @@ def main_menu(installer: ReShadeInstaller) -> Optional[str]:
     """Display main menu and get user choice."""
     saved_games = installer.games_config.list_all()
 
-    choices = [
-        questionary.Choice("Install ReShade to a game", value="install"),
-        questionary.Choice("Uninstall ReShade from a game", value="uninstall"),
-        questionary.Choice("Update shaders", value="update_shaders"),
-        questionary.Choice("Update ReShade", value="update_reshade"),
-    ]
+    choices = menu_choices(MAIN_MENU_ENTRIES)
 
     if saved_games:
         choices.append(questionary.Choice(
@@ -1048,10 +1562,7 @@ def main_menu(installer: ReShadeInstaller) -> Optional[str]:
             value="reinstall",
         ))
 
-    choices.extend([
-        questionary.Choice("Settings", value="settings"),
-        questionary.Choice("Exit", value="exit"),
-    ])
+    choices.extend(menu_choices(MAIN_MENU_TAIL_ENTRIES))
 
     return ask_select("What would you like to do?", choices)
 
@@ -1059,10 +1570,14 @@ def main_menu(installer: ReShadeInstaller) -> Optional[str]:
 def discover_game(installer: ReShadeInstaller) -> Optional[GameInfo]:
     """Scan Steam, let the user pick or browse, return an analyzed GameInfo."""
     console.print("\n[bold cyan]Scanning for Steam games...[/]")
-    games = installer.steam_scanner.scan_for_games()
+    games = installer.scan_games()
     console.print(f"[green]Found {len(games)} games[/]\n")
 
     selection = select_game(games)
+    while selection == "rescan":
+        games = installer.scan_games(force=True)
+        console.print(f"[green]Found {len(games)} games[/]\n")
+        selection = select_game(games)
     if selection is None:
         return None
     if selection == "manual":
@@ -1093,17 +1608,13 @@ def run_install_flow(installer: ReShadeInstaller) -> None:
         dll_used = installer.install_to_game(game)
 
         console.print(Panel(
-            f"""[bold green]Installation complete![/]
-
-[cyan]Game:[/] {game.name}
-[cyan]Install path:[/] {game.install_path}
-[cyan]API:[/] {game.detected_api.upper()} ({game.architecture}-bit)
-[cyan]DLL:[/] {dll_used}.dll
-
-[yellow]Steam Launch Options:[/]
-[bold]WINEDLLOVERRIDES="d3dcompiler_47=n;{dll_used}=n,b" %command%[/]
-
-[dim]Copy this to Steam -> Right-click game -> Properties -> Launch Options[/]""",
+            INSTALL_SUCCESS_TEMPLATE.format(
+                name=game.name,
+                install_path=str(game.install_path),
+                api=game.detected_api.upper(),
+                arch=game.architecture,
+                dll_used=dll_used,
+            ),
             title="Success",
             box=box.ROUNDED,
         ))
@@ -1178,24 +1689,19 @@ def run_uninstall_flow(installer: ReShadeInstaller) -> None:
 
 def run_settings_menu(installer: ReShadeInstaller) -> None:
     """Settings configuration menu."""
+    # The main path can't change from this menu, so stringify it once
+    main_path = str(installer.config.main_path)
     while True:
         console.print(f"""
 [bold cyan]Current Settings:[/]
-  Main path: {installer.config.main_path}
+  Main path: {main_path}
   ReShade version: {installer.config.reshade_version}
   Addon support: {installer.config.addon_support}
   Merge shaders: {installer.config.merge_shaders}
   Saved games: {len(installer.games_config.list_all())}
 """)
 
-        choices = [
-            questionary.Choice("Toggle addon support", value="addon"),
-            questionary.Choice("Toggle shader merging", value="merge"),
-            questionary.Choice("Clear saved games", value="clear_games"),
-            questionary.Choice("Back to main menu", value="back"),
-        ]
-
-        choice = ask_select("Configure:", choices)
+        choice = ask_select("Configure:", menu_choices(SETTINGS_ENTRIES))
 
         if choice == "addon":
             installer.config.addon_support = not installer.config.addon_support
@@ -1205,8 +1711,7 @@ def run_settings_menu(installer: ReShadeInstaller) -> None:
             console.print(f"[green]Merge shaders: {installer.config.merge_shaders}[/]")
         elif choice == "clear_games":
             if ask_confirm("Clear all saved game configurations?", default=False):
-                installer.config.games_config_path.unlink(missing_ok=True)
-                installer.games_config = GamesConfigManager(installer.config.games_config_path)
+                installer.games_config.clear()
                 console.print("[green]Saved games cleared.[/]")
         elif choice == "back" or choice is None:
             break
@@ -1228,8 +1733,12 @@ def initial_setup(installer: ReShadeInstaller) -> bool:
             return False
 
     # Check for shaders
-    shader_count = len(list(installer.config.merged_path.glob("Shaders/*.fx")))
-    if shader_count == 0:
+    try:
+        with os.scandir(installer.config.merged_path / "Shaders") as it:
+            has_shaders = any(entry.name.endswith(".fx") for entry in it)
+    except FileNotFoundError:
+        has_shaders = False
+    if not has_shaders:
         if ask_confirm("No shaders installed. Download shader repositories now?", default=True):
             repos = select_shader_repos()
             if repos:
@@ -1266,7 +1775,7 @@ def main() -> None:
                 installer.download_all_shaders(repos)
         elif action == "update_reshade":
             try:
-                version, url = installer.get_latest_reshade_version()
+                version, url = installer.get_latest_reshade_version(force=True)
                 console.print(f"[cyan]Downloading ReShade {version}...[/]")
                 installer.download_reshade(version, url)
                 console.print(f"[green]ReShade updated to {version}[/]")
@@ -1278,6 +1787,9 @@ def main() -> None:
             console.print("[cyan]Goodbye![/]")
             break
 
+        # Persist whatever the action changed in one write
+        installer.games_config.flush()
+
 
 if __name__ == "__main__":
     try: